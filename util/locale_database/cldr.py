@@ -37,8 +37,15 @@ See individual classes for further detail.
 """
 
 from xml.dom import minidom
+from xml.etree.ElementTree import iterparse
 from weakref import WeakValueDictionary as CacheDict
+from hashlib import sha1
+from tempfile import mkstemp
+from shutil import rmtree
 import os
+import pickle
+import re
+import time
 
 from ldml import Error, Node, XmlScanner, Supplement, LocaleScanner
 from qlocalexml import Locale
@@ -76,12 +83,12 @@ class CldrReader (object):
                 give = self.__parseTags(use)
             except Error as e:
                 if ((use.startswith(got) or got.startswith('und_'))
-                    and e.message.startswith('Unknown ') and ' code ' in e.message):
+                    and str(e).startswith('Unknown ') and ' code ' in str(e)):
                     skips.append(use)
                 else:
-                    self.grumble('Skipping likelySubtag "{}" -> "{}" ({})\n'.format(got, use, e.message))
+                    self.grumble('Skipping likelySubtag "{}" -> "{}" ({})\n'.format(got, use, e))
                 continue
-            if all(code.startswith('Any') and code[3].isupper() for code in have[:-1]):
+            if have[:-1] == ('AnyLanguage', 'AnyScript', 'AnyCountry'):
                 continue
 
             give = (give[0],
@@ -98,15 +105,71 @@ class CldrReader (object):
             # more out.
             pass # self.__wrapped(self.whitter, 'Skipping likelySubtags (for unknown codes): ', skips)
 
-    def readLocales(self, calendars = ('gregorian',)):
-        locales = tuple(self.__allLocales(calendars))
+    def readLocales(self, calendars = ('gregorian',), jobs = 1, cache = None):
+        """Digest the data for all locales.
+
+        Returns a mapping from (language, script, country, variant)
+        ID-tuples to Locale objects.  Optional first argument,
+        calendars, lists the calendars whose month names are wanted.
+
+        Optional second argument, jobs, is the number of processes
+        among which to share the work of reading locales.  Each locale
+        is read independently, so this scales well on multi-core
+        hosts; but worker processes inherit this reader by fork(), so
+        pass jobs > 1 only on platforms that support it.
+
+        Optional third argument, cache, is the path of an existing
+        directory in which to save each locale's data, so that later
+        runs can reuse it.  Saved data is keyed by the contents of the
+        CLDR files and of these scripts, so is not reused once either
+        has changed; data saved for other inputs is removed once it
+        has gone unused for a day.  As saved data is unpickled, a
+        cache directory that others can write to is not used."""
+        tasks = tuple(self.__localeTasks())
+        self.__cache = self.__cacheFor(cache, calendars) if cache else None
+        read = self.__cachedLocale if self.__cache else self.__readLocale
+
+        if jobs > 1:
+            from multiprocessing import get_context
+            self.root.preload() # Once, here, rather than in each worker.
+            pool = get_context('fork').Pool(jobs, _setLocaleReader, (read, calendars))
+            try:
+                # Use imap(), not imap_unordered(), so that later locales
+                # still win, as they do in the serial case, when two share
+                # a key. A chunk of consecutive (sorted) locales shares
+                # ancestors, which a worker then only parses once.
+                # Workers pass back their messages, to be reported here,
+                # in the same order as the serial case reports them.
+                locales = []
+                for locale, messages in pool.imap(_readLocale, tasks, 16):
+                    for log, text in messages:
+                        getattr(self, log)(text)
+                    if locale:
+                        locales.append(locale)
+            except BaseException:
+                pool.terminate() # Don't wait for the remaining tasks.
+                raise
+            else:
+                pool.close()
+            finally:
+                pool.join()
+        else:
+            try:
+                locales = tuple(k for k in (read(calendars, *task) for task in tasks) if k)
+            finally:
+                self.__scan = None # Release the last locale's files.
+
         return dict(((k.language_id, k.script_id, k.country_id, k.variant_code),
                      k) for k in locales)
 
-    def __allLocales(self, calendars):
-        def skip(locale, reason):
-            return 'Skipping defaultContent locale "{}" ({})\n'.format(locale, reason)
+    def __localeTasks(self):
+        """Generate (locale, tags) pairs for each locale to read.
 
+        For a default content locale, tags is its (language, script,
+        country, variant) tuple of codes; locales that we don't want
+        are skipped.  For a file locale, tags is None, as its codes
+        are read from its file."""
+        skip = self.__skipDefault
         for locale in self.root.defaultContentLocales:
             try:
                 language, script, country, variant = self.__splitLocale(locale)
@@ -121,90 +184,186 @@ class CldrReader (object):
             if not (language and country):
                 continue
 
-            try:
-                yield self.__getLocaleData(self.root.locale(locale), calendars,
-                                           language, script, country, variant)
-            except Error as e:
-                self.grumble(skip(locale, e.message))
+            yield locale, (language, script, country, variant)
 
         for locale in self.root.fileLocales:
+            yield locale, None
+
+    @staticmethod
+    def __skipDefault(locale, reason):
+        return 'Skipping defaultContent locale "{}" ({})\n'.format(locale, reason)
+
+    __scan = None
+    def __readLocale(self, calendars, locale, tags):
+        """Read one locale, as described by __localeTasks().
+
+        Returns a Locale object or, if the locale is to be skipped,
+        None."""
+        # Each locale's chain of files is only cached as long as some
+        # scanner is using it; hold the previous scanner until the next
+        # is built, so consecutive (sorted) locales with common
+        # ancestors need not re-parse the files they share.
+        if tags:
             try:
-                chain = self.root.locale(locale)
-                language, script, country, variant = chain.tagCodes()
-                assert language
-                # TODO: this skip should probably be based on likely
-                # sub-tags, instead of empty country: if locale has a
-                # likely-subtag expansion, that's what QLocale uses,
-                # and we'll be saving its data for the expanded locale
-                # anyway, so don't need to record it for itself.
-                # See also QLocaleXmlReader.loadLocaleMap's grumble.
-                if not country:
-                    continue
-                yield self.__getLocaleData(chain, calendars, language, script, country, variant)
+                self.__scan = scan = self.root.locale(locale)
+                return self.__getLocaleData(scan, calendars, *tags)
             except Error as e:
-                self.grumble('Skipping file locale "{}" ({})\n'.format(locale, e.message))
+                self.grumble(self.__skipDefault(locale, e))
+            return None
+
+        try:
+            self.__scan = scan = self.root.locale(locale)
+            language, script, country, variant = scan.tagCodes()
+            assert language
+            # TODO: this skip should probably be based on likely
+            # sub-tags, instead of empty country: if locale has a
+            # likely-subtag expansion, that's what QLocale uses,
+            # and we'll be saving its data for the expanded locale
+            # anyway, so don't need to record it for itself.
+            # See also QLocaleXmlReader.loadLocaleMap's grumble.
+            if country:
+                return self.__getLocaleData(scan, calendars, language, script, country, variant)
+        except Error as e:
+            self.grumble('Skipping file locale "{}" ({})\n'.format(locale, e))
+        return None
+
+    def __inputDigest(self, calendars, digester = sha1, joinPath = os.path.join,
+                      listDirectory = os.listdir,
+                      here = os.path.dirname(__file__) or os.curdir):
+        """Digest of all the inputs on which any locale's data depends.
+
+        Covers the calendars asked for and the contents of the CLDR
+        main and supplemental XML files, its DTDs and the scripts that
+        read them; any change to these changes the digest."""
+        digest = digester(repr(tuple(calendars)).encode('utf-8'))
+        for path, ext in ((joinPath(self.root.root, 'common', 'main'), '.xml'),
+                          (joinPath(self.root.root, 'common', 'supplemental'), '.xml'),
+                          (joinPath(self.root.root, 'common', 'dtd'), '.dtd'),
+                          (here, '.py')):
+            for name in sorted(listDirectory(path)):
+                if name.endswith(ext):
+                    digest.update(name.encode('utf-8') + b'\0')
+                    with open(joinPath(path, name), 'rb') as fd:
+                        digest.update(fd.read())
+        return digest.hexdigest()
 
-    import textwrap
     @staticmethod
-    def __wrapped(writer, prefix, tokens, wrap = textwrap.wrap):
-        writer('\n'.join(wrap(prefix + ', '.join(tokens),
-                              subsequent_indent=' ', width=80)) + '\n')
-    del textwrap
+    def __isPrivate(path, status = os.stat, getuid = getattr(os, 'getuid', None)):
+        """True if path is owned by, and only writable by, this user.
+
+        Where there's no POSIX ownership to check, returns True."""
+        if getuid is None:
+            return True
+        info = status(path)
+        return info.st_uid == getuid() and not info.st_mode & 0o022
+
+    # Sub-directory of the cache directory that this reader manages:
+    __cacheTop = 'locales-v1'
+    def __cacheFor(self, cache, calendars, joinPath = os.path.join,
+                   listDirectory = os.listdir, makeDirectory = os.makedirs,
+                   removeTree = rmtree, touch = os.utime, modified = os.path.getmtime,
+                   isDigest = re.compile('[0-9a-f]{40}$').match, now = time.time):
+        """Prepare the sub-directory of cache for the current inputs.
+
+        Saved data is unpickled, which can run arbitrary code, so a
+        cache directory that others could write to is refused.  Data
+        is saved in a sub-directory, of one this reader manages, named
+        for the digest of its inputs; any other sub-directory there
+        that hasn't been used for a day holds data for stale inputs,
+        so is removed.  Returns the path of the sub-directory for the
+        current inputs or, if it is refused or can't be created, None."""
+        digest = self.__inputDigest(calendars)
+        top = joinPath(cache, self.__cacheTop)
+        try:
+            if not self.__isPrivate(cache):
+                self.grumble('Not using cache {}: others can write to it\n'.format(cache))
+                return None
+            makeDirectory(top, 0o700, exist_ok=True)
+            if not self.__isPrivate(top):
+                self.grumble('Not using cache {}: others can write to it\n'.format(top))
+                return None
+
+            path = joinPath(top, digest)
+            makeDirectory(path, 0o700, exist_ok=True)
+            touch(path) # Mark as in use, so no concurrent run prunes it.
+            stale = now() - 24 * 60 * 60
+            for name in listDirectory(top):
+                if name != digest and isDigest(name) and modified(joinPath(top, name)) < stale:
+                    removeTree(joinPath(top, name), True)
+        except OSError:
+            return None
+        return path
+
+    __cache = None
+    # Fixed, rather than HIGHEST_PROTOCOL, so that all Python 3.4+ can
+    # read what any other wrote:
+    __pickleProtocol = 4
+    def __cachedLocale(self, calendars, locale, tags, digester = sha1, makeTemp = mkstemp,
+                       joinPath = os.path.join, openFile = os.fdopen,
+                       replace = os.replace, remove = os.remove):
+        """As __readLocale(), but reusing data saved by an earlier run.
+
+        Only locales successfully read are saved, so those skipped are
+        read (and complained about) afresh each time.  Any failure to
+        load saved data just means reading the locale again.  Each file
+        is written under a temporary name and renamed into place, so
+        that worker processes sharing the cache never see a partial
+        file."""
+        directory = self.__cache
+        key = digester(repr((locale, tags)).encode('utf-8')).hexdigest()
+        path = joinPath(directory, key + '.pickle')
+        try:
+            with open(path, 'rb') as fd:
+                return pickle.load(fd)
+        except Exception:
+            pass
+
+        data = self.__readLocale(calendars, locale, tags)
+        if data:
+            try:
+                fd, temp = makeTemp('.tmp', key, directory)
+            except OSError:
+                return data # Not writable: just do without.
+            try:
+                with openFile(fd, 'wb') as out:
+                    pickle.dump(data, out, self.__pickleProtocol)
+                replace(temp, path)
+            except Exception: # Failing to save is no reason to fail the read.
+                remove(temp)
+            except BaseException:
+                remove(temp)
+                raise
+        return data
+
+    @staticmethod
+    def __wrapped(writer, prefix, tokens):
+        writer(prefix + '\n  ' + '\n  '.join(tokens) + '\n')
 
     def __parseTags(self, locale):
         tags = self.__splitLocale(locale)
-        language = tags.next()
-        script = country = variant = ''
-        try:
-            script, country, variant = tags
-        except ValueError:
-            pass
+        language = tags[0]
+        script, country, variant = tags[1:] or ('', '', '')
         return tuple(p[1] for p in self.root.codesToIdName(language, script, country, variant))
 
+    # Language, script, territory, variant and any unparsed cruft:
+    __localeTags = re.compile(r'([^_]*)(?:_([A-Z][a-z]{3}))?(?:_([A-Z0-9]+))?'
+                              r'(?:_([A-Z0-9]+))?(?:_(.*))?$')
     def __splitLocale(self, name):
-        """Generate (language, script, territory, variant) from a locale name
+        """Split a locale name into (language, script, territory, variant)
 
         Ignores any trailing fields (with a warning), leaves script (a
         capitalised four-letter token), territory (either a number or
         an all-uppercase token) or variant (upper case and digits)
-        empty if unspecified.  Only generates one entry if name is a
-        single tag (i.e. contains no underscores).  Always yields 1 or
-        4 values, never 2 or 3."""
-        tags = iter(name.split('_'))
-        yield tags.next() # Language
-        tag = tags.next() # may raise StopIteration
-
-        # Script is always four letters, always capitalised:
-        if len(tag) == 4 and tag[0].isupper() and tag[1:].islower():
-            yield tag
-            try:
-                tag = tags.next()
-            except StopIteration:
-                tag = ''
-        else:
-            yield ''
+        empty if unspecified.  Returns only the language, as a 1-tuple,
+        if name is a single tag (i.e. contains no underscores); else a
+        4-tuple, never 2 or 3 entries."""
+        if '_' not in name:
+            return name,
 
-        # Territory is upper-case or numeric:
-        if tag and tag.isupper() or tag.isdigit():
-            yield tag
-            try:
-                tag = tags.next()
-            except StopIteration:
-                tag = ''
-        else:
-            yield ''
-
-        # Variant can be any mixture of upper-case and digits.
-        if tag and all(c.isupper() or c.isdigit() for c in tag):
-            yield tag
-            tag = ''
-        else:
-            yield ''
-
-        # If nothing is left, StopIteration will avoid the warning:
-        if not tag:
-            tag = tags.next()
-        self.grumble('Ignoring unparsed cruft {} in {}\n'.format('_'.join(tag + tuple(tags)), name))
+        language, script, country, variant, cruft = self.__localeTags.match(name).groups('')
+        if cruft:
+            self.grumble('Ignoring unparsed cruft {} in {}\n'.format(cruft, name))
+        return language, script, country, variant
 
     def __getLocaleData(self, scan, calendars, language, script, country, variant):
         ids, names = zip(*self.root.codesToIdName(language, script, country, variant))
@@ -237,6 +396,24 @@ class CldrReader (object):
 
         return locale
 
+# Process-pool support for CldrReader.readLocales(): each worker
+# process is forked with the reader's bound __readLocale method, whose
+# grumble and whitter are redirected to record messages for the parent
+# process to report.
+def _setLocaleReader(read, calendars):
+    global _localeReader, _localeMessages
+    _localeReader = read, calendars
+    _localeMessages = []
+    read.__self__.grumble = lambda text: _localeMessages.append(('grumble', text))
+    read.__self__.whitter = lambda text: _localeMessages.append(('whitter', text))
+
+def _readLocale(task):
+    read, calendars = _localeReader
+    try:
+        return read(calendars, *task), tuple(_localeMessages)
+    finally:
+        del _localeMessages[:]
+
 # Note: various caches assume this class is a singleton, so the
 # "default" value for a parameter no caller should pass can serve as
 # the cache. If a process were to instantiate this class with distinct
@@ -274,23 +451,22 @@ class CldrAccess (object):
         return LocaleScanner(name, self.__localeRoots(name), self.__rootLocale)
 
     @property
-    def fileLocales(self, joinPath = os.path.join, listDirectory = os.listdir,
-                    splitExtension = os.path.splitext):
+    def fileLocales(self):
         """Generator for locale IDs seen in file-names.
 
         All *.xml other than root.xml in common/main/ are assumed to
-        identify locales."""
-        for name in listDirectory(joinPath(self.root, 'common', 'main')):
-            stem, ext = splitExtension(name)
-            if ext == '.xml' and stem != 'root':
+        identify locales.  They are generated in sorted order, so that
+        locales sharing ancestors are visited consecutively."""
+        for stem in sorted(self.__mainLocales):
+            if stem != 'root':
                 yield stem
 
     @property
     def defaultContentLocales(self):
         """Generator for the default content locales."""
-        for name, attrs in self.supplement('supplementalMetadata.xml').find('metadata/defaultContent'):
+        for elt in self.__streamSupplement('supplementalMetadata.xml', 'defaultContent'):
             try:
-                locales = attrs['locales']
+                locales = elt.attrib['locales']
             except KeyError:
                 pass
             else:
@@ -298,13 +474,13 @@ class CldrAccess (object):
                     yield locale
 
     def likelySubTags(self):
-        for ignore, attrs in self.supplement('likelySubtags.xml').find('likelySubtags'):
-            yield attrs['from'], attrs['to']
+        for elt in self.__streamSupplement('likelySubtags.xml', 'likelySubtag'):
+            yield elt.attrib['from'], elt.attrib['to']
 
     def numberSystem(self, system):
         """Get a description of a numbering system.
 
-        Returns a mapping, with keys u'digits', u'type' and u'id'; the
+        Returns a mapping, with keys 'digits', 'type' and 'id'; the
         value for this last is system. Raises KeyError for unknown
         number system, ldml.Error on failure to load data."""
         try:
@@ -332,10 +508,21 @@ class CldrAccess (object):
         mode).  If CLDR provides no data for this country, ('', 2, 1)
         is the default result.
         """
-        try:
-            return self.__currencyData[country]
-        except KeyError:
-            return '', 2, 1
+        iso = self.__regionCurrency.get(country, '')
+        digits, rounding = self.__currencyFractions.get(iso, (2, 1))
+        return iso, digits, rounding
+
+    def preload(self):
+        """Load the data that reading any locale needs.
+
+        Each is otherwise only loaded when first needed.  Calling this
+        before forking processes to read locales lets them all share
+        the parent process's copy, instead of each loading its own."""
+        (self.__rootLocale, self.__numberSystems, self.__weekData,
+         self.__regionCurrency, self.__currencyFractions,
+         self.__parentLocale, self.__unDistinguishedAttributes)
+        self.__enumMap('language')
+        self.__codeMap('language')
 
     def codesToIdName(self, language, script, country, variant = ''):
         """Maps each code to the appropriate ID and name.
@@ -366,7 +553,7 @@ class CldrAccess (object):
                 text = '{} code {}'.format(key, value)
                 name = naming.get(value)
                 if name and value != 'POSIX':
-                    text += u' (could add {})'.format(name)
+                    text += ' (could add {})'.format(name)
                 parts.append(text)
         if len(parts) > 1:
             parts[-1] = 'and ' + parts[-1]
@@ -376,10 +563,10 @@ class CldrAccess (object):
 
     @staticmethod
     def __checkEnum(given, proper, scraps,
-                    remap = { u'å': 'a', u'ã': 'a', u'ç': 'c', u'é': 'e', u'í': 'i', u'ü': 'u'},
+                    remap = { 'å': 'a', 'ã': 'a', 'ç': 'c', 'é': 'e', 'í': 'i', 'ü': 'u'},
                     prefix = { 'St.': 'Saint', 'U.S.': 'United States' },
                     suffixes = ( 'Han', ),
-                    skip = u'\u02bc'):
+                    skip = '\u02bc'):
         # Each is a { code: full name } mapping
         for code, name in given.items():
             try: right = proper[code]
@@ -407,7 +594,7 @@ class CldrAccess (object):
 
     def checkEnumData(self, grumble):
         scraps = set()
-        for k in self.__parentLocale.keys():
+        for k in self.__parentLocale:
             for f in k.split('_'):
                 scraps.add(f)
         from enumdata import language_list, country_list, script_list
@@ -479,7 +666,7 @@ enumdata.py (keeping the old name as an alias):
                 key = 0
             data['windowsKey'] = key
 
-            if code == u'001':
+            if code == '001':
                 defaults[key] = data['ianaList']
             else:
                 try:
@@ -514,8 +701,19 @@ enumdata.py (keeping the old name as an alias):
             cache[path] = doc = read(joinPath(self.root, *path)).documentElement
         return doc
 
+    def __streamSupplement(self, name, tag, parse = iterparse, joinPath = os.path.join):
+        """Generate each element with the given tag in a supplemental file.
+
+        Unlike supplement(), this streams the file rather than loading
+        a DOM of it; each element is cleared once it has been seen, so
+        it should not be retained by the caller."""
+        for event, elt in parse(joinPath(self.root, 'common', 'supplemental', name)):
+            if elt.tag == tag:
+                yield elt
+            elt.clear()
+
     def __open(self, path, joinPath=os.path.join):
-        return open(joinPath(self.root, *path))
+        return open(joinPath(self.root, *path), encoding='utf-8')
 
     @property
     def __rootLocale(self, cache = []):
@@ -574,32 +772,32 @@ enumdata.py (keeping the old name as an alias):
             yield result
 
     @property
-    def __currencyData(self, cache = {}):
+    def __regionCurrency(self, cache = {}):
+        """Mapping from country code to ISO 4217 code of its currency."""
         if not cache:
-            source = self.__supplementalData
-            for elt in source.findNodes('currencyData/region'):
-                iso, digits, rounding = '', 2, 1
+            for elt in self.__supplementalData.findNodes('currencyData/region'):
                 try:
                     country = elt.dom.attributes['iso3166'].nodeValue
                 except KeyError:
                     continue
                 for child in elt.findAllChildren('currency'):
-                    try:
-                        if child.dom.attributes['tender'].nodeValue == 'false':
-                            continue
-                    except KeyError:
-                        pass
-                    try:
-                        child.dom.attributes['to'] # Is set if this element has gone out of date.
-                    except KeyError:
-                        iso = child.dom.attributes['iso4217'].nodeValue
+                    attrs = dict(child.dom.attributes.items())
+                    if attrs.get('tender') == 'false':
+                        continue
+                    if 'to' not in attrs: # Is set if this element has gone out of date.
+                        cache[country] = attrs['iso4217']
                         break
-                if iso:
-                    for tag, data in source.find(
-                        'currencyData/fractions/info[iso4217={}]'.format(iso)):
-                        digits = data['digits']
-                        rounding = data['rounding']
-                cache[country] = iso, digits, rounding
+            assert cache
+
+        return cache
+
+    @property
+    def __currencyFractions(self, cache = {}):
+        """Mapping from ISO 4217 code to (digit count, rounding mode)."""
+        if not cache:
+            for tag, data in self.__supplementalData.find('currencyData/fractions'):
+                if tag == 'info':
+                    cache[data['iso4217']] = data['digits'], data['rounding']
             assert cache
 
         return cache
@@ -721,7 +919,7 @@ enumdata.py (keeping the old name as an alias):
             except (KeyError, ValueError, TypeError):
                 pass
             else:
-                if key not in seen or not elt.attributes.has_key('alt'):
+                if key not in seen or 'alt' not in elt.attributes:
                     yield key, value
                     seen.add(key)
 
@@ -738,11 +936,25 @@ enumdata.py (keeping the old name as an alias):
 
         return cache
 
-    def __localeAsDoc(self, name, aliasFor = None,
-                      joinPath = os.path.join, exists = os.path.isfile):
-        path = ('common', 'main', name + '.xml')
-        if exists(joinPath(self.root, *path)):
-            elt = self.__xml(path)
+    @property
+    def __mainLocales(self, cache = set(), joinPath = os.path.join,
+                      listDirectory = os.listdir, splitExtension = os.path.splitext):
+        """The set of locale names with a .xml file in common/main/.
+
+        Listing the directory once saves checking for each locale's
+        file, and each of its ancestors', as every locale is read."""
+        if not cache:
+            for name in listDirectory(joinPath(self.root, 'common', 'main')):
+                stem, ext = splitExtension(name)
+                if ext == '.xml':
+                    cache.add(stem)
+            assert cache
+
+        return cache
+
+    def __localeAsDoc(self, name, aliasFor = None):
+        if name in self.__mainLocales:
+            elt = self.__xml(('common', 'main', name + '.xml'))
             for child in Node(elt).findAllChildren('alias'):
                 try:
                     alias = child.dom.attributes['source'].nodeValue
@@ -780,4 +992,4 @@ enumdata.py (keeping the old name as an alias):
         return chain
 
 # Unpolute the namespace: we don't need to export these.
-del minidom, CacheDict, os
+del minidom, iterparse, CacheDict, sha1, mkstemp, rmtree, os, re, time
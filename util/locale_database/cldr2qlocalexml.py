@@ -1,4 +1,4 @@
-#!/usr/bin/env python2
+#!/usr/bin/env python3
 # coding=utf8
 #############################################################################
 ##
@@ -48,6 +48,18 @@ append new entries to enumdata.py's lists and update documentation in
 src/corelib/text/qlocale.qdoc, adding the new entries in alphabetic
 order.
 
+Each locale's data is saved in a qt-cldr/ sub-directory of the user's
+cache directory ($XDG_CACHE_HOME, defaulting to ~/.cache), so that
+re-running on the same CLDR data with unchanged scripts can reuse it.
+Changing either invalidates what was saved, which the next run then
+removes; the directory can safely be deleted at any time. Set the
+environment variable QT_CLDR_CACHE to the path of a directory to use
+instead or to an empty string to save nothing. Saved data is loaded
+with pickle, which can run arbitrary code: anyone able to write to the
+cache directory could run code as you. A cache directory not owned by
+you, or writable by others, is therefore refused; do not point
+QT_CLDR_CACHE at a shared directory.
+
 While updating the locale data, check also for updates to MS-Win's
 time zone names; see cldr2qtimezone.py for details.
 
@@ -56,6 +68,7 @@ time zone names; see cldr2qtimezone.py for details.
 
 import os
 import sys
+from multiprocessing import cpu_count, get_all_start_methods
 
 from cldr import CldrReader
 from qlocalexml import QLocaleXmlWriter
@@ -67,6 +80,21 @@ def usage(name, err, message = ''):
     if message:
         err.write('\n' + message + '\n')
 
+def cacheDirectory():
+    """Directory in which to save locale data, or None if unwanted or unavailable."""
+    path = os.environ.get('QT_CLDR_CACHE')
+    if path is None:
+        path = os.path.join(os.environ.get('XDG_CACHE_HOME')
+                            or os.path.join(os.path.expanduser('~'), '.cache'),
+                            'qt-cldr')
+    elif not path:
+        return None
+    try:
+        os.makedirs(path, 0o700, exist_ok=True)
+    except OSError:
+        return None
+    return path
+
 def main(args, out, err):
     # TODO: make calendars a command-line option
     calendars = ['gregorian', 'persian', 'islamic'] # 'hebrew'
@@ -92,7 +120,7 @@ def main(args, out, err):
         return 1
     else:
         try:
-            emit = open(xml, 'w')
+            emit = open(xml, 'w', encoding='utf-8')
         except IOError as e:
             usage(name, err, 'Failed to open "{}" to write output to it\n'.format(xml))
             return 1
@@ -101,9 +129,10 @@ def main(args, out, err):
         usage(name, err, 'Too many arguments - excess: ' + ' '.join(args))
         return 1
 
-    if emit.encoding != 'UTF-8' or (emit.encoding is None and sys.getdefaultencoding() != 'UTF-8'):
-        reload(sys) # Weirdly, this gets a richer sys module than the plain import got us !
-        sys.setdefaultencoding('UTF-8')
+    # A text stream with no encoding (e.g. io.StringIO) takes str as is;
+    # otherwise, switch to UTF-8 (reconfigure() needs Python 3.7 or later):
+    if emit.encoding and emit.encoding.lower() not in ('utf-8', 'utf8'):
+        emit.reconfigure(encoding='utf-8')
 
     # TODO - command line options to tune choice of grumble and whitter:
     reader = CldrReader(root, err.write, err.write)
@@ -112,7 +141,9 @@ def main(args, out, err):
     writer.version(reader.root.cldrVersion)
     writer.enumData(language_list, script_list, country_list)
     writer.likelySubTags(reader.likelySubTags())
-    writer.locales(reader.readLocales(calendars), calendars)
+    # Worker processes are forked, which only POSIX supports:
+    jobs = cpu_count() if 'fork' in get_all_start_methods() else 1
+    writer.locales(reader.readLocales(calendars, jobs, cacheDirectory()), calendars)
 
     writer.close()
     return 0
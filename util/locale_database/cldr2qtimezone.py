@@ -1,4 +1,4 @@
-#!/usr/bin/env python2
+#!/usr/bin/env python3
 #############################################################################
 ##
 ## Copyright (C) 2020 The Qt Company Ltd.
@@ -54,190 +54,190 @@ from cldr import CldrAccess
 # Not public so may safely be changed.  Please keep in alphabetic order by ID.
 # ( Windows Id, Offset Seconds )
 windowsIdList = (
-    (u'Afghanistan Standard Time',        16200),
-    (u'Alaskan Standard Time',           -32400),
-    (u'Aleutian Standard Time',          -36000),
-    (u'Altai Standard Time',              25200),
-    (u'Arab Standard Time',               10800),
-    (u'Arabian Standard Time',            14400),
-    (u'Arabic Standard Time',             10800),
-    (u'Argentina Standard Time',         -10800),
-    (u'Astrakhan Standard Time',          14400),
-    (u'Atlantic Standard Time',          -14400),
-    (u'AUS Central Standard Time',        34200),
-    (u'Aus Central W. Standard Time',     31500),
-    (u'AUS Eastern Standard Time',        36000),
-    (u'Azerbaijan Standard Time',         14400),
-    (u'Azores Standard Time',             -3600),
-    (u'Bahia Standard Time',             -10800),
-    (u'Bangladesh Standard Time',         21600),
-    (u'Belarus Standard Time',            10800),
-    (u'Bougainville Standard Time',       39600),
-    (u'Canada Central Standard Time',    -21600),
-    (u'Cape Verde Standard Time',         -3600),
-    (u'Caucasus Standard Time',           14400),
-    (u'Cen. Australia Standard Time',     34200),
-    (u'Central America Standard Time',   -21600),
-    (u'Central Asia Standard Time',       21600),
-    (u'Central Brazilian Standard Time', -14400),
-    (u'Central Europe Standard Time',      3600),
-    (u'Central European Standard Time',    3600),
-    (u'Central Pacific Standard Time',    39600),
-    (u'Central Standard Time (Mexico)',  -21600),
-    (u'Central Standard Time',           -21600),
-    (u'China Standard Time',              28800),
-    (u'Chatham Islands Standard Time',    45900),
-    (u'Cuba Standard Time',              -18000),
-    (u'Dateline Standard Time',          -43200),
-    (u'E. Africa Standard Time',          10800),
-    (u'E. Australia Standard Time',       36000),
-    (u'E. Europe Standard Time',           7200),
-    (u'E. South America Standard Time',  -10800),
-    (u'Easter Island Standard Time',     -21600),
-    (u'Eastern Standard Time',           -18000),
-    (u'Eastern Standard Time (Mexico)',  -18000),
-    (u'Egypt Standard Time',               7200),
-    (u'Ekaterinburg Standard Time',       18000),
-    (u'Fiji Standard Time',               43200),
-    (u'FLE Standard Time',                 7200),
-    (u'Georgian Standard Time',           14400),
-    (u'GMT Standard Time',                    0),
-    (u'Greenland Standard Time',         -10800),
-    (u'Greenwich Standard Time',              0),
-    (u'GTB Standard Time',                 7200),
-    (u'Haiti Standard Time',             -18000),
-    (u'Hawaiian Standard Time',          -36000),
-    (u'India Standard Time',              19800),
-    (u'Iran Standard Time',               12600),
-    (u'Israel Standard Time',              7200),
-    (u'Jordan Standard Time',              7200),
-    (u'Kaliningrad Standard Time',         7200),
-    (u'Korea Standard Time',              32400),
-    (u'Libya Standard Time',               7200),
-    (u'Line Islands Standard Time',       50400),
-    (u'Lord Howe Standard Time',          37800),
-    (u'Magadan Standard Time',            36000),
-    (u'Magallanes Standard Time',        -10800), # permanent DST
-    (u'Marquesas Standard Time',         -34200),
-    (u'Mauritius Standard Time',          14400),
-    (u'Middle East Standard Time',         7200),
-    (u'Montevideo Standard Time',        -10800),
-    (u'Morocco Standard Time',                0),
-    (u'Mountain Standard Time (Mexico)', -25200),
-    (u'Mountain Standard Time',          -25200),
-    (u'Myanmar Standard Time',            23400),
-    (u'N. Central Asia Standard Time',    21600),
-    (u'Namibia Standard Time',             3600),
-    (u'Nepal Standard Time',              20700),
-    (u'New Zealand Standard Time',        43200),
-    (u'Newfoundland Standard Time',      -12600),
-    (u'Norfolk Standard Time',            39600),
-    (u'North Asia East Standard Time',    28800),
-    (u'North Asia Standard Time',         25200),
-    (u'North Korea Standard Time',        30600),
-    (u'Omsk Standard Time',               21600),
-    (u'Pacific SA Standard Time',        -10800),
-    (u'Pacific Standard Time',           -28800),
-    (u'Pacific Standard Time (Mexico)',  -28800),
-    (u'Pakistan Standard Time',           18000),
-    (u'Paraguay Standard Time',          -14400),
-    (u'Qyzylorda Standard Time',          18000), # a.k.a. Kyzylorda, in Kazakhstan
-    (u'Romance Standard Time',             3600),
-    (u'Russia Time Zone 3',               14400),
-    (u'Russia Time Zone 10',              39600),
-    (u'Russia Time Zone 11',              43200),
-    (u'Russian Standard Time',            10800),
-    (u'SA Eastern Standard Time',        -10800),
-    (u'SA Pacific Standard Time',        -18000),
-    (u'SA Western Standard Time',        -14400),
-    (u'Saint Pierre Standard Time',      -10800), # New France
-    (u'Sakhalin Standard Time',           39600),
-    (u'Samoa Standard Time',              46800),
-    (u'Sao Tome Standard Time',               0),
-    (u'Saratov Standard Time',            14400),
-    (u'SE Asia Standard Time',            25200),
-    (u'Singapore Standard Time',          28800),
-    (u'South Africa Standard Time',        7200),
-    (u'Sri Lanka Standard Time',          19800),
-    (u'Sudan Standard Time',               7200), # unless they mean South Sudan, +03:00
-    (u'Syria Standard Time',               7200),
-    (u'Taipei Standard Time',             28800),
-    (u'Tasmania Standard Time',           36000),
-    (u'Tocantins Standard Time',         -10800),
-    (u'Tokyo Standard Time',              32400),
-    (u'Tomsk Standard Time',              25200),
-    (u'Tonga Standard Time',              46800),
-    (u'Transbaikal Standard Time',        32400), # Yakutsk
-    (u'Turkey Standard Time',              7200),
-    (u'Turks And Caicos Standard Time',  -14400),
-    (u'Ulaanbaatar Standard Time',        28800),
-    (u'US Eastern Standard Time',        -18000),
-    (u'US Mountain Standard Time',       -25200),
-    (u'UTC-11',                          -39600),
-    (u'UTC-09',                          -32400),
-    (u'UTC-08',                          -28800),
-    (u'UTC-02',                           -7200),
-    (u'UTC',                                  0),
-    (u'UTC+12',                           43200),
-    (u'UTC+13',                           46800),
-    (u'Venezuela Standard Time',         -16200),
-    (u'Vladivostok Standard Time',        36000),
-    (u'Volgograd Standard Time',          14400),
-    (u'W. Australia Standard Time',       28800),
-    (u'W. Central Africa Standard Time',   3600),
-    (u'W. Europe Standard Time',           3600),
-    (u'W. Mongolia Standard Time',        25200), # Hovd
-    (u'West Asia Standard Time',          18000),
-    (u'West Bank Standard Time',           7200),
-    (u'West Pacific Standard Time',       36000),
-    (u'Yakutsk Standard Time',            32400),
-    (u'Yukon Standard Time',             -25200), # Non-DST Mountain Standard Time since 2020-11-01
+    ('Afghanistan Standard Time',        16200),
+    ('Alaskan Standard Time',           -32400),
+    ('Aleutian Standard Time',          -36000),
+    ('Altai Standard Time',              25200),
+    ('Arab Standard Time',               10800),
+    ('Arabian Standard Time',            14400),
+    ('Arabic Standard Time',             10800),
+    ('Argentina Standard Time',         -10800),
+    ('Astrakhan Standard Time',          14400),
+    ('Atlantic Standard Time',          -14400),
+    ('AUS Central Standard Time',        34200),
+    ('Aus Central W. Standard Time',     31500),
+    ('AUS Eastern Standard Time',        36000),
+    ('Azerbaijan Standard Time',         14400),
+    ('Azores Standard Time',             -3600),
+    ('Bahia Standard Time',             -10800),
+    ('Bangladesh Standard Time',         21600),
+    ('Belarus Standard Time',            10800),
+    ('Bougainville Standard Time',       39600),
+    ('Canada Central Standard Time',    -21600),
+    ('Cape Verde Standard Time',         -3600),
+    ('Caucasus Standard Time',           14400),
+    ('Cen. Australia Standard Time',     34200),
+    ('Central America Standard Time',   -21600),
+    ('Central Asia Standard Time',       21600),
+    ('Central Brazilian Standard Time', -14400),
+    ('Central Europe Standard Time',      3600),
+    ('Central European Standard Time',    3600),
+    ('Central Pacific Standard Time',    39600),
+    ('Central Standard Time (Mexico)',  -21600),
+    ('Central Standard Time',           -21600),
+    ('China Standard Time',              28800),
+    ('Chatham Islands Standard Time',    45900),
+    ('Cuba Standard Time',              -18000),
+    ('Dateline Standard Time',          -43200),
+    ('E. Africa Standard Time',          10800),
+    ('E. Australia Standard Time',       36000),
+    ('E. Europe Standard Time',           7200),
+    ('E. South America Standard Time',  -10800),
+    ('Easter Island Standard Time',     -21600),
+    ('Eastern Standard Time',           -18000),
+    ('Eastern Standard Time (Mexico)',  -18000),
+    ('Egypt Standard Time',               7200),
+    ('Ekaterinburg Standard Time',       18000),
+    ('Fiji Standard Time',               43200),
+    ('FLE Standard Time',                 7200),
+    ('Georgian Standard Time',           14400),
+    ('GMT Standard Time',                    0),
+    ('Greenland Standard Time',         -10800),
+    ('Greenwich Standard Time',              0),
+    ('GTB Standard Time',                 7200),
+    ('Haiti Standard Time',             -18000),
+    ('Hawaiian Standard Time',          -36000),
+    ('India Standard Time',              19800),
+    ('Iran Standard Time',               12600),
+    ('Israel Standard Time',              7200),
+    ('Jordan Standard Time',              7200),
+    ('Kaliningrad Standard Time',         7200),
+    ('Korea Standard Time',              32400),
+    ('Libya Standard Time',               7200),
+    ('Line Islands Standard Time',       50400),
+    ('Lord Howe Standard Time',          37800),
+    ('Magadan Standard Time',            36000),
+    ('Magallanes Standard Time',        -10800), # permanent DST
+    ('Marquesas Standard Time',         -34200),
+    ('Mauritius Standard Time',          14400),
+    ('Middle East Standard Time',         7200),
+    ('Montevideo Standard Time',        -10800),
+    ('Morocco Standard Time',                0),
+    ('Mountain Standard Time (Mexico)', -25200),
+    ('Mountain Standard Time',          -25200),
+    ('Myanmar Standard Time',            23400),
+    ('N. Central Asia Standard Time',    21600),
+    ('Namibia Standard Time',             3600),
+    ('Nepal Standard Time',              20700),
+    ('New Zealand Standard Time',        43200),
+    ('Newfoundland Standard Time',      -12600),
+    ('Norfolk Standard Time',            39600),
+    ('North Asia East Standard Time',    28800),
+    ('North Asia Standard Time',         25200),
+    ('North Korea Standard Time',        30600),
+    ('Omsk Standard Time',               21600),
+    ('Pacific SA Standard Time',        -10800),
+    ('Pacific Standard Time',           -28800),
+    ('Pacific Standard Time (Mexico)',  -28800),
+    ('Pakistan Standard Time',           18000),
+    ('Paraguay Standard Time',          -14400),
+    ('Qyzylorda Standard Time',          18000), # a.k.a. Kyzylorda, in Kazakhstan
+    ('Romance Standard Time',             3600),
+    ('Russia Time Zone 3',               14400),
+    ('Russia Time Zone 10',              39600),
+    ('Russia Time Zone 11',              43200),
+    ('Russian Standard Time',            10800),
+    ('SA Eastern Standard Time',        -10800),
+    ('SA Pacific Standard Time',        -18000),
+    ('SA Western Standard Time',        -14400),
+    ('Saint Pierre Standard Time',      -10800), # New France
+    ('Sakhalin Standard Time',           39600),
+    ('Samoa Standard Time',              46800),
+    ('Sao Tome Standard Time',               0),
+    ('Saratov Standard Time',            14400),
+    ('SE Asia Standard Time',            25200),
+    ('Singapore Standard Time',          28800),
+    ('South Africa Standard Time',        7200),
+    ('Sri Lanka Standard Time',          19800),
+    ('Sudan Standard Time',               7200), # unless they mean South Sudan, +03:00
+    ('Syria Standard Time',               7200),
+    ('Taipei Standard Time',             28800),
+    ('Tasmania Standard Time',           36000),
+    ('Tocantins Standard Time',         -10800),
+    ('Tokyo Standard Time',              32400),
+    ('Tomsk Standard Time',              25200),
+    ('Tonga Standard Time',              46800),
+    ('Transbaikal Standard Time',        32400), # Yakutsk
+    ('Turkey Standard Time',              7200),
+    ('Turks And Caicos Standard Time',  -14400),
+    ('Ulaanbaatar Standard Time',        28800),
+    ('US Eastern Standard Time',        -18000),
+    ('US Mountain Standard Time',       -25200),
+    ('UTC-11',                          -39600),
+    ('UTC-09',                          -32400),
+    ('UTC-08',                          -28800),
+    ('UTC-02',                           -7200),
+    ('UTC',                                  0),
+    ('UTC+12',                           43200),
+    ('UTC+13',                           46800),
+    ('Venezuela Standard Time',         -16200),
+    ('Vladivostok Standard Time',        36000),
+    ('Volgograd Standard Time',          14400),
+    ('W. Australia Standard Time',       28800),
+    ('W. Central Africa Standard Time',   3600),
+    ('W. Europe Standard Time',           3600),
+    ('W. Mongolia Standard Time',        25200), # Hovd
+    ('West Asia Standard Time',          18000),
+    ('West Bank Standard Time',           7200),
+    ('West Pacific Standard Time',       36000),
+    ('Yakutsk Standard Time',            32400),
+    ('Yukon Standard Time',             -25200), # Non-DST Mountain Standard Time since 2020-11-01
 )
 
 # List of standard UTC IDs to use.  Not public so may be safely changed.
 # Do not remove IDs, as each entry is part of the API/behavior guarantee.
 # ( UTC Id, Offset Seconds )
 utcIdList = (
-    (u'UTC',            0),  # Goes first so is default
-    (u'UTC-14:00', -50400),
-    (u'UTC-13:00', -46800),
-    (u'UTC-12:00', -43200),
-    (u'UTC-11:00', -39600),
-    (u'UTC-10:00', -36000),
-    (u'UTC-09:00', -32400),
-    (u'UTC-08:00', -28800),
-    (u'UTC-07:00', -25200),
-    (u'UTC-06:00', -21600),
-    (u'UTC-05:00', -18000),
-    (u'UTC-04:30', -16200),
-    (u'UTC-04:00', -14400),
-    (u'UTC-03:30', -12600),
-    (u'UTC-03:00', -10800),
-    (u'UTC-02:00',  -7200),
-    (u'UTC-01:00',  -3600),
-    (u'UTC-00:00',      0),
-    (u'UTC+00:00',      0),
-    (u'UTC+01:00',   3600),
-    (u'UTC+02:00',   7200),
-    (u'UTC+03:00',  10800),
-    (u'UTC+03:30',  12600),
-    (u'UTC+04:00',  14400),
-    (u'UTC+04:30',  16200),
-    (u'UTC+05:00',  18000),
-    (u'UTC+05:30',  19800),
-    (u'UTC+05:45',  20700),
-    (u'UTC+06:00',  21600),
-    (u'UTC+06:30',  23400),
-    (u'UTC+07:00',  25200),
-    (u'UTC+08:00',  28800),
-    (u'UTC+08:30',  30600),
-    (u'UTC+09:00',  32400),
-    (u'UTC+09:30',  34200),
-    (u'UTC+10:00',  36000),
-    (u'UTC+11:00',  39600),
-    (u'UTC+12:00',  43200),
-    (u'UTC+13:00',  46800),
-    (u'UTC+14:00',  50400),
+    ('UTC',            0),  # Goes first so is default
+    ('UTC-14:00', -50400),
+    ('UTC-13:00', -46800),
+    ('UTC-12:00', -43200),
+    ('UTC-11:00', -39600),
+    ('UTC-10:00', -36000),
+    ('UTC-09:00', -32400),
+    ('UTC-08:00', -28800),
+    ('UTC-07:00', -25200),
+    ('UTC-06:00', -21600),
+    ('UTC-05:00', -18000),
+    ('UTC-04:30', -16200),
+    ('UTC-04:00', -14400),
+    ('UTC-03:30', -12600),
+    ('UTC-03:00', -10800),
+    ('UTC-02:00',  -7200),
+    ('UTC-01:00',  -3600),
+    ('UTC-00:00',      0),
+    ('UTC+00:00',      0),
+    ('UTC+01:00',   3600),
+    ('UTC+02:00',   7200),
+    ('UTC+03:00',  10800),
+    ('UTC+03:30',  12600),
+    ('UTC+04:00',  14400),
+    ('UTC+04:30',  16200),
+    ('UTC+05:00',  18000),
+    ('UTC+05:30',  19800),
+    ('UTC+05:45',  20700),
+    ('UTC+06:00',  21600),
+    ('UTC+06:30',  23400),
+    ('UTC+07:00',  25200),
+    ('UTC+08:00',  28800),
+    ('UTC+08:30',  30600),
+    ('UTC+09:00',  32400),
+    ('UTC+09:30',  34200),
+    ('UTC+10:00',  36000),
+    ('UTC+11:00',  39600),
+    ('UTC+12:00',  43200),
+    ('UTC+13:00',  46800),
+    ('UTC+14:00',  50400),
 )
 
 ### End of data that may need updates in response to CLDR ###
@@ -363,11 +363,11 @@ def main(args, out, err):
             dict((name, ind) for ind, name in enumerate((x[0] for x in windowsIdList), 1)))
     except IOError as e:
         usage(err, name,
-              'Failed to open common/supplemental/windowsZones.xml: ' + (e.message or e.args[1]))
+              'Failed to open common/supplemental/windowsZones.xml: ' + str(e))
         return 1
     except Error as e:
         err.write('\n'.join(textwrap.wrap(
-                    'Failed to read windowsZones.xml: ' + (e.message or e.args[1]),
+                    'Failed to read windowsZones.xml: ' + str(e),
                     subsequent_indent=' ', width=80)) + '\n')
         return 1
 
@@ -375,14 +375,14 @@ def main(args, out, err):
     try:
         writer = ZoneIdWriter(dataFilePath, qtPath)
     except IOError as e:
-        err.write('Failed to open files to transcribe: {}'.format(e.message or e.args[1]))
+        err.write('Failed to open files to transcribe: {}'.format(e))
         return 1
 
     try:
         writer.write(version, defaults, winIds)
     except Error as e:
         writer.cleanup()
-        err.write('\nError in Windows ID data: ' + e.message + '\n')
+        err.write('\nError in Windows ID data: ' + str(e) + '\n')
         return 1
 
     writer.close()
@@ -858,26 +858,28 @@ script_aliases = {
     'BengaliScript': 'BanglaScript',
 }
 
+def _codeToIdMap(book):
+    # Map each code to the lowest ID that uses it (C shares AnyLanguage's):
+    ans = {}
+    for key in sorted(book.keys(), reverse=True):
+        ans[book[key][1]] = key
+    return ans
+
+_country_code_ids = _codeToIdMap(country_list)
+_language_code_ids = _codeToIdMap(language_list)
+_script_code_ids = _codeToIdMap(script_list)
+
 def countryCodeToId(code):
     if not code:
         return 0
-    for country_id in country_list:
-        if country_list[country_id][1] == code:
-            return country_id
-    return -1
+    return _country_code_ids.get(code, -1)
 
 def languageCodeToId(code):
     if not code:
         return 0
-    for language_id in language_list:
-        if language_list[language_id][1] == code:
-            return language_id
-    return -1
+    return _language_code_ids.get(code, -1)
 
 def scriptCodeToId(code):
     if not code:
         return 0
-    for script_id in script_list:
-        if script_list[script_id][1] == code:
-            return script_id
-    return -1
+    return _script_code_ids.get(code, -1)
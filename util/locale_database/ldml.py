@@ -124,7 +124,7 @@ class Node (object):
         one."""
         seq = self.findAllChildren(tag)
         try:
-            node = seq.next()
+            node = next(seq)
         except StopIteration:
             raise Error('No child found where one was expected', tag)
         for it in seq:
@@ -154,8 +154,14 @@ class Node (object):
     __draftScores = dict(true = 4, unconfirmed = 3, provisional = 2,
                          contributed = 1, approved = 0, false = 0)
 
-def _parseXPath(selector):
-    # Split "tag[attr=val][...]" into tag-name and attribute mapping
+def _parseXPath(selector, cache = {}):
+    # Split "tag[attr=val][...]" into tag-name and attribute mapping.
+    # The same few selectors recur for every locale, so each is only
+    # parsed once; callers must not modify the returned mapping.
+    try:
+        return cache[selector]
+    except KeyError:
+        pass
     attrs = selector.split('[')
     name = attrs.pop(0)
     if attrs:
@@ -164,7 +170,8 @@ def _parseXPath(selector):
         attrs = [x[:-1].split('=') for x in attrs]
         assert all(len(x) in (1, 2) for x in attrs)
         attrs = (('type', x[0]) if len(x) == 1 else x for x in attrs)
-    return name, dict(attrs)
+    cache[selector] = name, dict(attrs)
+    return cache[selector]
 
 def _iterateEach(iters):
     # Flatten a two-layer iterator.
@@ -197,12 +204,13 @@ class Supplement (XmlScanner):
                                 for e in elts):
             if elt.attributes:
                 yield (elt.nodeName,
-                       dict((k, v if isinstance(v, basestring) else v.nodeValue)
+                       dict((k, v if isinstance(v, str) else v.nodeValue)
                             for k, v in elt.attributes.items()))
 
 class LocaleScanner (object):
     def __init__(self, name, nodes, root):
         self.name, self.nodes, self.base = name, nodes, root
+        self.__walked = {} # see __findInNodes()
 
     def find(self, xpath, default = None, draft = None):
         """XPath search for the content of an element.
@@ -230,20 +238,10 @@ class LocaleScanner (object):
         The tag codes are language, script, country and variant; an
         empty value for any of them indicates that no value was
         provided.  The values are obtained from the primary file's
-        top-level <identity> element.  An Error is raised if any
-        top-level <alias> element of this file has a non-empty source
-        attribute; that attribute value is mentioned in the error's
-        message."""
-        root = self.nodes[0]
-        for alias in root.findAllChildren('alias', allDull=True):
-            try:
-                source = alias.dom.attributes['source'].nodeValue
-            except (KeyError, AttributeError):
-                pass
-            else:
-                raise Error('Alias to {}'.format(source))
-
-        ids = root.findUniqueChild('identity')
+        top-level <identity> element.  Any top-level <alias> with a
+        source has already been followed when loading the file, so
+        the primary file is never an alias."""
+        ids = self.nodes[0].findUniqueChild('identity')
         for code in ('language', 'script', 'territory', 'variant'):
             for node in ids.findAllChildren(code, allDull=True):
                 try:
@@ -276,7 +274,7 @@ class LocaleScanner (object):
 
         First argument, lookup, is a callable that maps a numbering
         system's name to certain data about the system, as a mapping;
-        we expect this to have u'digits' as a key.
+        we expect this to have 'digits' as a key.
         """
         system = self.find('numbers/defaultNumberingSystem')
         stem = 'numbers/symbols[numberSystem={}]/'.format(system)
@@ -312,7 +310,7 @@ class LocaleScanner (object):
         except Error:
             money = self.find(xpath)
         money = self.__currencyFormats(money, plus, minus)
-        yield 'currencyFormat', money.next()
+        yield 'currencyFormat', next(money)
         neg = ''
         for it in money:
             assert not neg, 'There should be at most one more pattern'
@@ -375,7 +373,7 @@ class LocaleScanner (object):
                          'bytes'))
 
         unit = self.__findUnit('', 'B')
-        cache = [] # Populated by the SI call, to give hints to the IEC call
+        cache = set() # Populated by the SI call, to give hints to the IEC call
         yield ('byte_si_quantified',
                ';'.join(self.__unitCount('', unit, cache)))
         # IEC 60027-2
@@ -390,17 +388,16 @@ class LocaleScanner (object):
             for key, mode, size in namings:
                 prop = 'monthContext[' + mode + ']/monthWidth[' + size + ']/'
                 yield (key + 'Months_' + cal,
-                       ';'.join(self.find(stem + prop + 'month[{}]'.format(i))
-                                for i in range(1, 13)))
+                       ';'.join(self.find(stem + prop + month)
+                                for month in self.__monthTails))
 
         # Day data (for Gregorian, at least):
         stem = 'dates/calendars/calendar[gregorian]/days/'
-        days = ('sun', 'mon', 'tue', 'wed', 'thu', 'fri', 'sat')
         for (key, mode, size) in namings:
             prop = 'dayContext[' + mode + ']/dayWidth[' + size + ']/day'
             yield (key + 'Days',
-                   ';'.join(self.find(stem + prop + '[' + day + ']')
-                            for day in days))
+                   ';'.join(self.find(stem + prop + day)
+                            for day in self.__dayTails))
 
     # Implementation details
     __nameForms = (
@@ -411,18 +408,16 @@ class LocaleScanner (object):
         ('short', 'format', 'abbreviated'),
         ('narrow', 'format', 'narrow'),
         ) # Used for month and day names
+    __monthTails = tuple('month[{}]'.format(i) for i in range(1, 13))
+    __dayTails = tuple('[{}]'.format(day) for day in
+                       ('sun', 'mon', 'tue', 'wed', 'thu', 'fri', 'sat'))
 
     def __find(self, xpath):
         retries = [ xpath.split('/') ]
         while retries:
-            tags, elts, roots = retries.pop(), self.nodes, (self.base.root,)
-            for selector in tags:
-                tag, attrs = _parseXPath(selector)
-                elts = tuple(_iterateEach(e.findAllChildren(tag, attrs) for e in elts))
-                if not elts:
-                    break
-
-            else: # Found matching elements
+            tags, roots = retries.pop(), (self.base.root,)
+            elts = self.__findInNodes(tuple(tags))
+            if elts: # Found matching elements
                 # Possibly filter elts to prefer the least drafty ?
                 for elt in elts:
                     yield elt
@@ -457,14 +452,31 @@ class LocaleScanner (object):
             sought += ' (for {})'.format(xpath)
         raise Error('No {} in {}'.format(sought, self.name))
 
-    def __currencyDisplayName(self, stem):
+    def __findInNodes(self, tags):
+        """All elements of self.nodes matching a sequence of selectors.
+
+        Single argument, tags, is a tuple of XPath selectors.  Results
+        are cached for each prefix of tags, so that searches sharing a
+        stem (e.g. for each month of a calendar) only walk it once."""
         try:
-            return self.find(stem + 'displayName')
-        except Error:
+            return self.__walked[tags]
+        except KeyError:
             pass
-        for x in  ('zero', 'one', 'two', 'few', 'many', 'other'):
+
+        elts = self.__findInNodes(tags[:-1]) if len(tags) > 1 else self.nodes
+        if elts:
+            tag, attrs = _parseXPath(tags[-1])
+            elts = tuple(_iterateEach(e.findAllChildren(tag, attrs) for e in elts))
+        self.__walked[tags] = elts
+        return elts
+
+    __displayNameTails = ('displayName',) + tuple(
+        'displayName[count={}]'.format(x)
+        for x in ('zero', 'one', 'two', 'few', 'many', 'other'))
+    def __currencyDisplayName(self, stem):
+        for tail in self.__displayNameTails:
             try:
-                return self.find(stem + 'displayName[count={}]'.format(x))
+                return self.find(stem + tail)
             except Error:
                 pass
         return ''
@@ -498,8 +510,11 @@ class LocaleScanner (object):
 
     def __unitCount(self, keySuffix, suffix, cache,
                     # Stop at exa/exbi: 16 exbi = 2^{64} < zetta =
-                    # 1000^7 < zebi = 2^{70}, the next quantifiers up:
-                    siQuantifiers = ('kilo', 'mega', 'giga', 'tera', 'peta', 'exa')):
+                    # 1000^7 < zebi = 2^{70}, the next quantifiers up;
+                    # each with its SI prefix (kB for kilobyte, in
+                    # contrast with KiB for IEC):
+                    siQuantifiers = (('kilo', 'k'), ('mega', 'M'), ('giga', 'G'),
+                                     ('tera', 'T'), ('peta', 'P'), ('exa', 'E'))):
         """Work out the unit quantifiers.
 
         Unfortunately, the CLDR data only go up to terabytes and we
@@ -510,30 +525,28 @@ class LocaleScanner (object):
         Po, Eo).
 
         Should be called first for the SI quantifiers, with suffix =
-        'B', then for the IEC ones, with suffix = 'iB'; the list cache
+        'B', then for the IEC ones, with suffix = 'iB'; the set cache
         (initially empty before first call) is used to let the second
         call know what the first learned about the localized unit.
         """
         if suffix == 'iB': # second call, re-using first's cache
             if cache:
                 byte = cache.pop()
-                if all(byte == k for k in cache):
+                if not cache: # All SI tails agreed
                     suffix = 'i' + byte
-            for q in siQuantifiers:
+            for q, prefix in siQuantifiers:
                 # Those don't (yet, v36) exist in CLDR, so we always get the fall-back:
-                yield self.__findUnit(keySuffix, q[:2], q[0].upper() + suffix)
+                yield self.__findUnit(keySuffix, q[:2], prefix.upper() + suffix)
         else: # first call
             tail = suffix = suffix or 'B'
-            for q in siQuantifiers:
+            for q, prefix in siQuantifiers:
                 it = self.__findUnit(keySuffix, q)
-                # kB for kilobyte, in contrast with KiB for IEC:
-                q = q[0] if q == 'kilo' else q[0].upper()
                 if not it:
-                    it = q + tail
-                elif it.startswith(q):
+                    it = prefix + tail
+                elif it.startswith(prefix):
                     rest = it[1:]
-                    tail = rest if all(rest == k for k in cache) else suffix
-                    cache.append(rest)
+                    tail = rest if cache <= {rest} else suffix
+                    cache.add(rest)
                 yield it
 
     def __numberGrouping(self, system):
@@ -567,25 +580,22 @@ class LocaleScanner (object):
         return size, size, top
 
     @staticmethod
-    def __currencyFormats(patterns, plus, minus):
+    def __currencyFormats(patterns, plus, minus,
+                          # Tables for str.translate():
+                          digits = str.maketrans('0', '#', ',.'),
+                          # According to http://www.unicode.org/reports/tr35/#Number_Format_Patterns
+                          # there can be doubled or trippled currency sign, however none of the
+                          # locales use that.
+                          fields = str.maketrans({'#': '%1', '\xa4': '%2'})):
+        signs = str.maketrans({'+': plus, '-': minus}) # Use number system's signs
         for p in patterns.split(';'):
-            p = p.replace('0', '#').replace(',', '').replace('.', '')
-            try:
-                cut = p.find('#') + 1
-            except ValueError:
-                pass
-            else:
-                p = p[:cut] + p[cut:].replace('#', '')
-            p = p.replace('#', "%1")
-            # According to http://www.unicode.org/reports/tr35/#Number_Format_Patterns
-            # there can be doubled or trippled currency sign, however none of the
-            # locales use that.
-            p = p.replace(u'\xa4', "%2")
+            p = p.translate(digits)
+            cut = p.find('#') + 1
+            p = p[:cut] + p[cut:].replace('#', '')
+            p = p.translate(fields)
             # Single quote goes away, but double goes to single:
             p = p.replace("''", '###').replace("'", '').replace('###', "'")
-            # Use number system's signs:
-            p = p.replace('+', plus).replace('-', minus)
-            yield p
+            yield p.translate(signs)
 
     @staticmethod
     def __fromLdmlListPattern(pattern):
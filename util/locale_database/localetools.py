@@ -40,8 +40,8 @@ Classes:
 import os
 import tempfile
 
-class Error (StandardError):
-    __upinit = StandardError.__init__
+class Error (Exception):
+    __upinit = Exception.__init__
     def __init__(self, msg, *args):
         self.__upinit(msg, *args)
         self.message = msg
@@ -84,11 +84,11 @@ class Transcriber (object):
     """
     def __init__(self, path, temp):
         # Open the old file
-        self.reader = open(path)
+        self.reader = open(path, encoding='utf-8')
         # Create a temp file to write the new data into
         temp, tempPath = tempfile.mkstemp(os.path.split(path)[1], dir = temp)
         self.__names = path, tempPath
-        self.writer = os.fdopen(temp, "w")
+        self.writer = os.fdopen(temp, "w", encoding='utf-8')
 
     def close(self):
         self.reader.close()
@@ -36,14 +36,13 @@ Provides classes:
 Support:
   Spacer -- provides control over indentation of the output.
 """
-from __future__ import print_function
 from xml.sax.saxutils import escape
 
 from localetools import Error
 
 # Tools used by Locale:
 def camel(seq):
-    yield seq.next()
+    yield next(seq)
     for word in seq:
         yield word.capitalize()
 
@@ -58,7 +57,7 @@ def startCount(c, text): # strspn
     """First index in text where it doesn't have a character in c"""
     assert text and text[0] in c
     try:
-        return (j for j, d in enumerate(text) if d not in c).next()
+        return next(j for j, d in enumerate(text) if d not in c)
     except StopIteration:
         return len(text)
 
@@ -131,6 +130,10 @@ class QLocaleXmlReader (object):
         self.__langByName = dict((v[1], (v[0], v[2])) for v in languages)
         self.__textByName = dict((v[1], (v[0], v[2])) for v in scripts)
         self.__landByName = dict((v[1], (v[0], v[2])) for v in countries)
+        # Private mappings {name: ID}, for when only the ID is wanted:
+        self.__langIdByName = dict((v[1], v[0]) for v in languages)
+        self.__textIdByName = dict((v[1], v[0]) for v in scripts)
+        self.__landIdByName = dict((v[1], v[0]) for v in countries)
         # Other properties:
         self.dupes = set(v[1] for v in languages) & set(v[1] for v in countries)
         self.cldrVersion = self.__firstChildText(self.root, "version")
@@ -140,9 +143,9 @@ class QLocaleXmlReader (object):
         likely = dict(self.__likely)
         for elt in self.__eachEltInGroup(self.root, 'localeList', 'locale'):
             locale = Locale.fromXmlData(lambda k: kid(elt, k), calendars)
-            language = self.__langByName[locale.language][0]
-            script = self.__textByName[locale.script][0]
-            country = self.__landByName[locale.country][0]
+            language = self.__langIdByName[locale.language]
+            script = self.__textIdByName[locale.script]
+            country = self.__landIdByName[locale.country]
 
             if language != 1: # C
                 if country == 0:
@@ -160,13 +163,13 @@ class QLocaleXmlReader (object):
                         pass
                     else:
                         locale.script = to[1]
-                        script = self.__textByName[locale.script][0]
+                        script = self.__textIdByName[locale.script]
 
             yield (language, script, country), locale
 
     def languageIndices(self, locales):
         index = 0
-        for key, value in self.languages.iteritems():
+        for key, value in self.languages.items():
             i, count = 0, locales.count(key)
             if count > 0:
                 i = index
@@ -198,9 +201,9 @@ class QLocaleXmlReader (object):
         for have, give in self.__likely:
             if have[1:] == ('AnyScript', 'AnyCountry') and give[2] != 'AnyCountry':
                 assert have[0] == give[0], (have, give)
-                yield ((self.__langByName[give[0]][0],
-                        self.__textByName[give[1]][0]),
-                       self.__landByName[give[2]][0])
+                yield ((self.__langIdByName[give[0]],
+                        self.__textIdByName[give[1]]),
+                       self.__landIdByName[give[2]])
 
     # Implementation details:
     def __loadMap(self, category):
@@ -352,9 +355,7 @@ class QLocaleXmlWriter (object):
         self.__openTag('locale')
         Locale.C(calendars).toXml(self.inTag, calendars)
         self.__closeTag('locale')
-        keys = locales.keys()
-        keys.sort()
-        for key in keys:
+        for key in sorted(locales):
             self.__openTag('locale')
             locales[key].toXml(self.inTag, calendars)
             self.__closeTag('locale')
@@ -381,7 +382,7 @@ class QLocaleXmlWriter (object):
 
     def __enumTable(self, tag, table):
         self.__openTag(tag + 'List')
-        for key, value in table.iteritems():
+        for key, value in table.items():
             self.__openTag(tag)
             self.inTag('name', value[0])
             self.inTag('id', key)
@@ -517,7 +518,7 @@ class Locale (object):
                 '_'.join((k, cal))
                 for k in self.propsMonthDay('months')
                 for cal in calendars):
-            write(key, escape(get(key)).encode('utf-8'))
+            write(key, escape(get(key)))
 
         write('groupSizes', ';'.join(str(x) for x in get('groupSizes')))
         for key in ('currencyDigits', 'currencyRounding'):
@@ -554,9 +555,9 @@ class Locale (object):
                         (fullName, fullName),
                         (firstThree, firstThree),
                         (number, initial)),
-            'islamic': ((u'Muharram', u'Safar', u'Rabiʻ I', u'Rabiʻ II', u'Jumada I',
-                         u'Jumada II', u'Rajab', u'Shaʻban', u'Ramadan', u'Shawwal',
-                         u'Dhuʻl-Qiʻdah', u'Dhuʻl-Hijjah'),
+            'islamic': (('Muharram', 'Safar', 'Rabiʻ I', 'Rabiʻ II', 'Jumada I',
+                         'Jumada II', 'Rajab', 'Shaʻban', 'Ramadan', 'Shawwal',
+                         'Dhuʻl-Qiʻdah', 'Dhuʻl-Hijjah'),
                         (fullName, fullName),
                         (islamicShort, islamicShort),
                         (number, number)),
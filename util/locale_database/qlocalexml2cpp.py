@@ -1,4 +1,4 @@
-#!/usr/bin/env python2
+#!/usr/bin/env python3
 #############################################################################
 ##
 ## Copyright (C) 2020 The Qt Company Ltd.
@@ -35,6 +35,7 @@ the root of the qtbase check-out as second parameter.
 
 import os
 import datetime
+from functools import cmp_to_key
 
 from qlocalexml import QLocaleXmlReader
 from localetools import unicode2hex, wrap_list, Error, Transcriber, SourceFileEditor
@@ -531,16 +532,15 @@ def main(args, out, err):
     reader = QLocaleXmlReader(qlocalexml)
     locale_map = dict(reader.loadLocaleMap(calendars, err.write))
 
-    locale_keys = locale_map.keys()
     compareLocaleKeys.default_map = dict(reader.defaultMap())
-    locale_keys.sort(compareLocaleKeys)
+    locale_keys = sorted(locale_map.keys(), key=cmp_to_key(compareLocaleKeys))
 
     try:
         writer = LocaleDataWriter(os.path.join(qtsrcdir,  'src', 'corelib', 'text',
                                                'qlocale_data_p.h'),
                                   qtsrcdir, reader.cldrVersion)
     except IOError as e:
-        err.write('Failed to open files to transcribe locale data: ' + (e.message or e.args[1]))
+        err.write('Failed to open files to transcribe locale data: ' + str(e))
         return 1
 
     try:
@@ -557,7 +557,7 @@ def main(args, out, err):
         writer.countryCodes(reader.countries)
     except Error as e:
         writer.cleanup()
-        err.write('\nError updating locale data: ' + e.message + '\n')
+        err.write('\nError updating locale data: ' + str(e) + '\n')
         return 1
 
     writer.close()
@@ -570,14 +570,14 @@ def main(args, out, err):
                                         qtsrcdir, reader.cldrVersion)
         except IOError as e:
             err.write('Failed to open files to transcribe ' + calendar
-                             + ' data ' + (e.message or e.args[1]))
+                             + ' data ' + str(e))
             return 1
 
         try:
             writer.write(calendar, locale_map, locale_keys)
         except Error as e:
             writer.cleanup()
-            err.write('\nError updating ' + calendar + ' locale data: ' + e.message + '\n')
+            err.write('\nError updating ' + calendar + ' locale data: ' + str(e) + '\n')
             return 1
 
         writer.close()
@@ -587,7 +587,7 @@ def main(args, out, err):
         writer = LocaleHeaderWriter(os.path.join(qtsrcdir, 'src', 'corelib', 'text', 'qlocale.h'),
                                     qtsrcdir, reader.dupes)
     except IOError as e:
-        err.write('Failed to open files to transcribe qlocale.h: ' + (e.message or e.args[1]))
+        err.write('Failed to open files to transcribe qlocale.h: ' + str(e))
         return 1
 
     try:
@@ -596,7 +596,7 @@ def main(args, out, err):
         writer.countries(reader.countries)
     except Error as e:
         writer.cleanup()
-        err.write('\nError updating qlocale.h: ' + e.message + '\n')
+        err.write('\nError updating qlocale.h: ' + str(e) + '\n')
         return 1
 
     writer.close()
@@ -606,7 +606,7 @@ def main(args, out, err):
         writer = Transcriber(os.path.join(qtsrcdir, 'src', 'corelib', 'text', 'qlocale.qdoc'),
                              qtsrcdir)
     except IOError as e:
-        err.write('Failed to open files to transcribe qlocale.qdoc: ' + (e.message or e.args[1]))
+        err.write('Failed to open files to transcribe qlocale.qdoc: ' + str(e))
         return 1
 
     DOCSTRING = "    QLocale's data is based on Common Locale Data Repository "
@@ -618,7 +618,7 @@ def main(args, out, err):
                 writer.writer.write(line)
     except Error as e:
         writer.cleanup()
-        err.write('\nError updating qlocale.qdoc: ' + e.message + '\n')
+        err.write('\nError updating qlocale.qdoc: ' + str(e) + '\n')
         return 1
 
     writer.close()